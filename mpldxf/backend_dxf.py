@@ -35,11 +35,14 @@ CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 """
 
 from __future__ import absolute_import, division, print_function, unicode_literals
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from io import BytesIO, StringIO
 import os
 import sys
 import math
 import re
+from types import MappingProxyType
 
 import matplotlib
 from matplotlib.backend_bases import (
@@ -48,15 +51,15 @@ from matplotlib.backend_bases import (
     GraphicsContextBase,
     FigureManagerBase,
 )
+from matplotlib.path import Path
 from matplotlib.transforms import Affine2D
 import matplotlib.transforms as transforms
 import matplotlib.collections as mplc
 import numpy as np
-from shapely import Point
 from shapely.geometry import LineString, Polygon
 import ezdxf
+from ezdxf.entities import LWPolyline
 from ezdxf.enums import TextEntityAlignment
-from ezdxf.math.clipping import Clipping, ClippingRect2d, ConvexClippingPolygon2d
 
 from . import dxf_colors
 
@@ -75,13 +78,325 @@ def rgb_to_dxf(rgb_val):
     alpha value is ignored.
     """
     if rgb_val is None:
-        dxfcolor = dxf_colors.WHITE
+        key = None
     # change black to white
-    elif np.allclose(np.array(rgb_val[:3]), np.zeros(3)):
-        dxfcolor = dxf_colors.nearest_index([255, 255, 255])
+    elif rgb_val[0] <= 1e-8 and rgb_val[1] <= 1e-8 and rgb_val[2] <= 1e-8:
+        key = (255, 255, 255)
     else:
-        dxfcolor = dxf_colors.nearest_index([255.0 * val for val in rgb_val[:3]])
-    return dxfcolor
+        key = tuple(int(round(255 * val)) for val in rgb_val[:3])
+    return _rgb_to_dxf_cached(key)
+
+
+@lru_cache(maxsize=4096)
+def _rgb_to_dxf_cached(key):
+    """Look up the DXF colour index for an 8-bit RGB tuple.
+
+    Figures reuse a handful of colours for thousands of entities, so
+    the palette search only runs once per distinct colour.
+    """
+    if key is None:
+        return dxf_colors.WHITE
+    return dxf_colors.nearest_index(key)
+
+
+# Patterns used to strip simple mathtext markup from text
+_MATHBF_RE = re.compile(r"\\mathbf\{(.*?)\}")
+_DOLLAR_RE = re.compile(r"[$]")
+_SLASH_RE = re.compile(r"\\/")
+
+# Polylines with at least this many vertices are clipped with NumPy.
+_MIN_VECTORISED_CLIP = 32
+
+
+def _isclose_point(a, b, abs_tol=1e-10):
+    """Check if two 2D points coincide within ``abs_tol``."""
+    return abs(a[0] - b[0]) <= abs_tol and abs(a[1] - b[1]) <= abs_tol
+
+
+def _clip_segments(vertices, x0, y0, x1, y1, abs_tol=1e-10):
+    """Liang-Barsky clip all segments of a polyline at once.
+
+    ``vertices`` is an (N, 2) float array. Returns the clipped vertices
+    packed into one array together with the offsets of each part, so
+    part ``i`` is ``out[offsets[i]:offsets[i + 1]]``.
+    """
+    a = vertices[:-1]
+    b = vertices[1:]
+    d = b - a
+    p = np.stack([-d[:, 0], d[:, 0], -d[:, 1], d[:, 1]], axis=1)
+    q = np.stack([a[:, 0] - x0, x1 - a[:, 0], a[:, 1] - y0, y1 - a[:, 1]], axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = q / p
+    t0 = np.where(p < 0, t, 0.0).max(axis=1)
+    t1 = np.where(p > 0, t, 1.0).min(axis=1)
+    # drop zero-length segments and those outside or only touching the rectangle
+    keep = (t0 < t1) & ~((p == 0) & (q < 0)).any(axis=1) & (d != 0).any(axis=1)
+
+    a, b, d = a[keep], b[keep], d[keep]
+    t0, t1 = t0[keep, None], t1[keep, None]
+    starts = np.where(t0 > 0, a + t0 * d, a)
+    ends = np.where(t1 < 1, a + t1 * d, b)
+
+    # a new part begins wherever a segment does not continue the last one
+    begins = np.ones(len(starts), dtype=bool)
+    begins[1:] = (np.abs(ends[:-1] - starts[1:]) > abs_tol).any(axis=1)
+    pos = np.arange(len(ends)) + np.cumsum(begins)
+    out = np.empty((len(ends) + np.count_nonzero(begins), 2))
+    out[pos] = ends
+    out[pos[begins] - 1] = starts[begins]
+    offsets = np.append(pos[begins] - 1, len(out))
+    return out, offsets
+
+
+def _clip_polyline_to_rect(vertices, x0, y0, x1, y1):
+    """Clip a polyline to the axis-aligned rectangle (x0, y0) - (x1, y1).
+
+    Each segment is clipped with the Liang-Barsky algorithm. Returns a
+    list of polylines, split wherever the polyline leaves the rectangle.
+    """
+    x0, y0, x1, y1 = float(x0), float(y0), float(x1), float(y1)
+    if len(vertices) >= _MIN_VECTORISED_CLIP:
+        out, offsets = _clip_segments(np.asarray(vertices, dtype=float), x0, y0, x1, y1)
+        return [out[i:j] for i, j in zip(offsets[:-1], offsets[1:])]
+
+    # for short polylines the NumPy call overhead outweighs the loop
+    points = [(float(x), float(y)) for x, y in vertices]
+    if len(points) == 1:
+        x, y = points[0]
+        if x0 <= x <= x1 and y0 <= y <= y1:
+            return [points]
+        return []
+
+    parts = []
+    for (ax, ay), (bx, by) in zip(points[:-1], points[1:]):
+        dx = bx - ax
+        dy = by - ay
+        t0, t1 = 0.0, 1.0
+        rejected = False
+        for p, q in ((-dx, ax - x0), (dx, x1 - ax), (-dy, ay - y0), (dy, y1 - ay)):
+            if p == 0:
+                # segment is parallel to this edge
+                if q < 0:
+                    rejected = True
+                    break
+                continue
+            t = q / p
+            if p < 0:
+                if t > t1:
+                    rejected = True
+                    break
+                t0 = max(t0, t)
+            else:
+                if t < t0:
+                    rejected = True
+                    break
+                t1 = min(t1, t)
+
+        # skip zero-length segments and those only touching the rectangle
+        if rejected or t0 == t1 or not (dx or dy):
+            continue
+        start = (ax + t0 * dx, ay + t0 * dy) if t0 > 0 else (ax, ay)
+        end = (ax + t1 * dx, ay + t1 * dy) if t1 < 1 else (bx, by)
+        if parts and _isclose_point(parts[-1][-1], start):
+            parts[-1].append(end)
+        else:
+            parts.append([start, end])
+    return parts
+
+
+def _convex_clip_edges(vertices):
+    """Get the edges of a convex polygon for Cyrus-Beck clipping.
+
+    Returns a list of ``(px, py, nx, ny)`` tuples, a point on each edge
+    and the edge's inward normal, or None if the polygon is not convex.
+    """
+    points = np.asarray(vertices, dtype=float)[:, :2]
+    # drop repeated vertices, including a closing vertex
+    points = points[np.any(points != np.roll(points, 1, axis=0), axis=1)]
+    if len(points) < 3:
+        return None
+
+    edges = np.roll(points, -1, axis=0) - points
+    following = np.roll(edges, -1, axis=0)
+    cross = edges[:, 0] * following[:, 1] - edges[:, 1] * following[:, 0]
+    dot = np.einsum("ij,ij->i", edges, following)
+    # a convex polygon turns the same way at every vertex, once around
+    turning = np.arctan2(cross, dot).sum()
+    if not (np.all(cross >= 0) or np.all(cross <= 0)):
+        return None
+    if abs(abs(turning) - 2 * np.pi) > 1e-6:
+        return None
+
+    # the left normal points inwards for a counter-clockwise polygon
+    sign = 1.0 if turning > 0 else -1.0
+    normals = sign * np.stack([-edges[:, 1], edges[:, 0]], axis=1)
+    return [
+        (px, py, nx, ny)
+        for (px, py), (nx, ny) in zip(points.tolist(), normals.tolist())
+    ]
+
+
+def _clip_segment_to_convex_poly(segment, edges):
+    """Clip a segment to a convex polygon with the Cyrus-Beck algorithm.
+
+    ``edges`` are as returned by ``_convex_clip_edges``. Returns the
+    clipped segment as a list of two points, or an empty list if nothing
+    of the segment lies inside the polygon.
+    """
+    (ax, ay), (bx, by) = [(float(x), float(y)) for x, y in segment]
+    dx = bx - ax
+    dy = by - ay
+    t0, t1 = 0.0, 1.0
+    for px, py, nx, ny in edges:
+        num = nx * (ax - px) + ny * (ay - py)
+        den = nx * dx + ny * dy
+        if den == 0:
+            # segment is parallel to this edge
+            if num < 0:
+                return []
+            continue
+        t = -num / den
+        if den > 0:
+            t0 = max(t0, t)
+        else:
+            t1 = min(t1, t)
+        if t0 >= t1:
+            return []
+    start = (ax + t0 * dx, ay + t0 * dy) if t0 > 0 else (ax, ay)
+    end = (ax + t1 * dx, ay + t1 * dy) if t1 < 1 else (bx, by)
+    return [start, end]
+
+
+def _clip_polyline_to_convex_poly(vertices, edges):
+    """Clip a polyline to a convex polygon, segment by segment.
+
+    Returns a list of polylines, split wherever the polyline leaves the
+    polygon, as ``_clip_polyline_to_rect`` does.
+    """
+    parts = []
+    for segment in zip(vertices[:-1], vertices[1:]):
+        clipped = _clip_segment_to_convex_poly(segment, edges)
+        if not clipped:
+            continue
+        start, end = clipped
+        if parts and _isclose_point(parts[-1][-1], start):
+            parts[-1].append(end)
+        else:
+            parts.append([start, end])
+    return parts
+
+
+def _clip_region(vertices):
+    """Prepare a closed polyline as a region to clip other polylines to.
+
+    Axis-aligned rectangles are clipped with Liang-Barsky, other convex
+    polygons with Cyrus-Beck and anything else with Shapely.
+    """
+    points = np.unique(np.asarray(vertices, dtype=float)[:, :2], axis=0)
+    xs = np.unique(points[:, 0])
+    ys = np.unique(points[:, 1])
+    if len(points) == 4 and len(xs) == 2 and len(ys) == 2:
+        return "rect", (xs[0], ys[0], xs[1], ys[1])
+    edges = _convex_clip_edges(vertices)
+    if edges is not None:
+        return "convex", edges
+    return "polygon", Polygon(vertices)
+
+
+def _clip_polyline_to_region(vertices, region):
+    """Clip a polyline to a region as returned by ``_clip_region``."""
+    kind, clip = region
+    if kind == "rect":
+        return _clip_polyline_to_rect(vertices, *clip)
+    if kind == "convex":
+        return _clip_polyline_to_convex_poly(vertices, clip)
+    line = LineString(vertices).intersection(clip)
+    if line.is_empty:
+        return []
+    geoms = line.geoms if hasattr(line, "geoms") else [line]
+    # skip points where the polyline only touches the region
+    return [list(geom.coords) for geom in geoms if len(geom.coords) > 1]
+
+
+def _clip_polygon_to_half_planes(vertices, edges):
+    """Clip a polygon to a convex region with Sutherland-Hodgman.
+
+    ``edges`` are as returned by ``_convex_clip_edges``. Returns the
+    vertices of the clipped polygon, or an empty list if nothing of the
+    polygon lies inside the region.
+    """
+    points = [(float(x), float(y)) for x, y in vertices]
+    if len(points) > 1 and points[0] == points[-1]:
+        points.pop()
+    for px, py, nx, ny in edges:
+        if not points:
+            break
+        dists = [nx * (x - px) + ny * (y - py) for x, y in points]
+        clipped = []
+        (ax, ay), da = points[-1], dists[-1]
+        for (bx, by), db in zip(points, dists):
+            if da * db < 0:
+                # the edge from a to b crosses the clip edge
+                t = da / (da - db)
+                clipped.append((ax + t * (bx - ax), ay + t * (by - ay)))
+            if db >= 0:
+                clipped.append((bx, by))
+            (ax, ay), da = (bx, by), db
+        points = clipped
+    return points if len(points) >= 3 else []
+
+
+def _clip_polygon_to_region(vertices, region):
+    """Clip a polygon to a region as returned by ``_clip_region``.
+
+    Returns a list of polygons, as clipping to a non-convex region can
+    split a polygon into several.
+    """
+    kind, clip = region
+    if kind == "rect":
+        x0, y0, x1, y1 = clip
+        clip = [
+            (x0, y0, 1.0, 0.0),
+            (x1, y1, -1.0, 0.0),
+            (x0, y0, 0.0, 1.0),
+            (x1, y1, 0.0, -1.0),
+        ]
+    if kind != "polygon":
+        clipped = _clip_polygon_to_half_planes(vertices, clip)
+        return [clipped] if clipped else []
+    area = Polygon(vertices).intersection(clip)
+    geoms = area.geoms if hasattr(area, "geoms") else [area]
+    return [
+        list(geom.exterior.coords)
+        for geom in geoms
+        if isinstance(geom, Polygon) and not geom.is_empty
+    ]
+
+
+# Translate matplotlib text alignments to parts of the ezdxf alignment names
+_HALIGN = {"left": "LEFT", "center": "CENTER", "right": "RIGHT"}
+_VALIGN = {
+    "top": "TOP",
+    "center": "MIDDLE",
+    "bottom": "BOTTOM",
+    "baseline": "",
+    "center_baseline": "MIDDLE",
+}
+
+
+def _build_align_table():
+    """Map (ha, va, vertical) of a matplotlib text to a TextEntityAlignment.
+
+    ``vertical`` is set for text rotated by 90 degrees without the anchor
+    rotation mode, which is always right aligned.
+    """
+    table = {}
+    for ha, halign in _HALIGN.items():
+        for va, valign in _VALIGN.items():
+            for vert in (False, True):
+                name = "_".join(filter(None, [valign, "RIGHT" if vert else halign]))
+                table[ha, va, vert] = TextEntityAlignment[name]
+    return MappingProxyType(table)
 
 
 class RendererDxf(RendererBase):
@@ -91,12 +406,18 @@ class RendererDxf(RendererBase):
     Renders the drawing using the ``ezdxf`` package.
     """
 
-    def __init__(self, width, height, dpi, dxfversion):
+    #: Map of (ha, va, vertical) of a matplotlib text to ezdxf text alignments
+    _ALIGN_TABLE = _build_align_table()
+
+    def __init__(self, width, height, dpi, dxfversion, simplify_tolerance=None):
         RendererBase.__init__(self)
         self.height = height
         self.width = width
         self.dpi = dpi
+        self._pt2px = dpi / 72.0
         self.dxfversion = dxfversion
+        self.simplify_tolerance = simplify_tolerance
+        self._hatch_cache = {}
         self._init_drawing()
         self._groupd = []
 
@@ -125,82 +446,87 @@ class RendererDxf(RendererBase):
         # clip the polygon if clip rectangle present
         bbox = gc.get_clip_rectangle()
         if bbox is not None:
-            cliprect = [
-                [bbox.x0, bbox.y0],
-                [bbox.x1, bbox.y0],
-                [bbox.x1, bbox.y1],
-                [bbox.x0, bbox.y1],
-            ]
-
-            if obj == "patch":
-                vertices = ClippingRect2d(cliprect[0], cliprect[2]).clip_polyline(
-                    vertices
-                )
-            elif obj == "line2d":
+            if obj == "line2d":
                 # strip nans
-                vertices = [v for v in vertices if not np.isnan(v).any()]
-
-                cliprect = Polygon(cliprect)
-                if (
-                    len(vertices) == 1
-                ):  # if there is only one data point for the line, create a Point object
-                    line = Point(vertices[0])
-                else:
-                    line = LineString(vertices)
-                try:
-                    intersection = line.intersection(cliprect)
-                except:
-                    intersection = Polygon()
-
-                # Check if intersection is a multi-part geometry
-                if intersection.is_empty:
-                    vertices = []  # No intersection
-                elif (
-                    "Multi" in intersection.geom_type
-                    or "GeometryCollection" in intersection.geom_type
-                ):
-                    # If intersection is a multi-part geometry, iterate
-                    vertices = [list(geom.coords) for geom in intersection.geoms]
-                else:
-                    # If intersection is not a multi-part geometry, get intersection coordinates directly
-                    vertices = list(intersection.coords)
+                vertices = vertices[~np.isnan(vertices).any(axis=1)]
+                if len(vertices) == 0:
+                    return []
+
+            # most paths lie entirely inside (or outside) the clip
+            # rectangle, so check the extents before clipping each segment
+            vmin = np.min(vertices, axis=0)
+            vmax = np.max(vertices, axis=0)
+            if len(vertices) > 1 and np.array_equal(vmin, vmax):
+                # a zero-length line draws nothing
+                return []
+            if (
+                vmin[0] >= bbox.x0
+                and vmax[0] <= bbox.x1
+                and vmin[1] >= bbox.y0
+                and vmax[1] <= bbox.y1
+            ):
+                return [vertices]
+            if (
+                vmax[0] < bbox.x0
+                or vmin[0] > bbox.x1
+                or vmax[1] < bbox.y0
+                or vmin[1] > bbox.y1
+            ):
+                return []
+
+            vertices = _clip_polyline_to_rect(
+                vertices, bbox.x0, bbox.y0, bbox.x1, bbox.y1
+            )
 
         return vertices
 
+    def _add_lwpolyline(self, points, dxfattribs):
+        """Add an open LWPOLYLINE with ``(x, y)`` points to the modelspace.
+
+        Unlike ``modelspace.add_lwpolyline`` this does not copy and check
+        ``dxfattribs`` for every entity, so one dict can be shared.
+        """
+        entity = LWPolyline.new(dxfattribs=dxfattribs, doc=self.drawing)
+        entity.set_points(points, format="xy")
+        self.modelspace.add_entity(entity)
+        return entity
+
+    def _simplify_polyline(self, points):
+        """Drop near-collinear vertices if a simplify tolerance is set."""
+        if self.simplify_tolerance is None or len(points) < 3:
+            return points
+        return list(LineString(points).simplify(self.simplify_tolerance).coords)
+
     def _draw_mpl_lwpoly(self, gc, path, transform, obj):
         dxfattribs = self._get_polyline_attribs(gc)
-        vertices = path.transformed(transform).vertices
+        vertices = transform.transform(path.vertices)
 
-        # clip the polygon if clip rectangle present
+        if len(vertices) == 0:
+            return None
 
-        if len(vertices) > 0:
-            if isinstance(vertices[0][0], float or np.float64):
-                vertices = self._clip_mpl(gc, vertices, obj=obj)
+        # clip the polygon if clip rectangle present, which splits it into
+        # a list of polylines
+        vertices = self._clip_mpl(gc, vertices, obj=obj)
 
+        if isinstance(vertices, np.ndarray) and vertices.ndim == 2:
+            # a single, unclipped polyline
+            if vertices[0][0] != 0:
+                # keep polylines open because closing them broke some arrows
+                entity = self._add_lwpolyline(
+                    self._simplify_polyline(vertices), dxfattribs
+                )
             else:
-                vertices = [self._clip_mpl(gc, points, obj=obj) for points in vertices]
-
-            # if vertices.
-            if len(vertices) == 0:
                 entity = None
 
-            else:
-                if isinstance(vertices[0][0], float or np.float64):
-                    if vertices[0][0] != 0:
-                        entity = self.modelspace.add_lwpolyline(
-                            points=vertices, close=False, dxfattribs=dxfattribs
-                        )  # set close to false because it broke some arrows
-                    else:
-                        entity = None
-
-                else:
-                    entity = [
-                        self.modelspace.add_lwpolyline(
-                            points=points, close=False, dxfattribs=dxfattribs
-                        )
-                        for points in vertices
-                    ]  # set close to false because it broke some arrows
-            return entity
+        elif len(vertices) == 0:
+            entity = None
+
+        else:
+            entity = [
+                self._add_lwpolyline(self._simplify_polyline(points), dxfattribs)
+                for points in vertices
+            ]
+        return entity
 
     def _draw_mpl_line2d(self, gc, path, transform):
         line = self._draw_mpl_lwpoly(gc, path, transform, obj="line2d")
@@ -213,9 +539,10 @@ class RendererDxf(RendererBase):
             return
         # check to see if the patch is filled
         if rgbFace is not None:
-            if type(poly) == list:
+            fillcolor = rgb_to_dxf(rgbFace)
+            if isinstance(poly, list):
                 for pol in poly:
-                    hatch = self.modelspace.add_hatch(color=rgb_to_dxf(rgbFace))
+                    hatch = self.modelspace.add_hatch(color=fillcolor)
                     hpath = hatch.paths.add_polyline_path(
                         # get path vertices from associated LWPOLYLINE entity
                         pol.get_points(format="xyb"),
@@ -226,7 +553,7 @@ class RendererDxf(RendererBase):
                     # Set association between boundary path and LWPOLYLINE
                     hatch.associate(hpath, [pol])
             else:
-                hatch = self.modelspace.add_hatch(color=rgb_to_dxf(rgbFace))
+                hatch = self.modelspace.add_hatch(color=fillcolor)
                 hpath = hatch.paths.add_polyline_path(
                     # get path vertices from associated LWPOLYLINE entity
                     poly.get_points(format="xyb"),
@@ -237,9 +564,36 @@ class RendererDxf(RendererBase):
                 # Set association between boundary path and LWPOLYLINE
                 hatch.associate(hpath, [poly])
 
-        self._draw_mpl_hatch(gc, path, transform, pline=poly)
+        # check to see if the patch is hatched
+        if gc.get_hatch() is not None:
+            self._draw_mpl_hatch(gc, path, transform)
 
-    def _draw_mpl_hatch(self, gc, path, transform, pline):
+    def _get_hatch_tiles(self, gc, rows, cols, cx, cy):
+        """Get the hatch polygons tiled around the point (cx, cy).
+
+        The hatch is repeated over (2 * rows + 1) x (2 * cols + 1) squares
+        of one inch, returning an (ntiles, nvertices, 2) array for each
+        polygon of the hatch.
+        """
+        # get the hatch as polygons of a properly scaled hatch centred
+        # on the origin, shared by all patches using the same pattern
+        hatch = gc.get_hatch()
+        base = self._hatch_cache.get((hatch, self.dpi))
+        if base is None:
+            hpath = gc.get_hatch_path()
+            _transform = Affine2D().translate(-0.5, -0.5).scale(self.dpi)
+            base = hpath.transformed(_transform).to_polygons(closed_only=False)
+            self._hatch_cache[hatch, self.dpi] = base
+
+        # centers of the hatch tiles needed to cover the parent path
+        irow, icol = np.meshgrid(
+            np.arange(-rows, rows + 1), np.arange(-cols, cols + 1), indexing="ij"
+        )
+        offsets = np.stack([cx + icol * self.dpi, cy + irow * self.dpi], axis=-1)
+        offsets = offsets.reshape(-1, 2)
+        return [polygon[None, :, :] + offsets[:, None, :] for polygon in base]
+
+    def _draw_mpl_hatch(self, gc, path, transform):
         """Draw MPL hatch"""
 
         hatch = gc.get_hatch()
@@ -259,57 +613,50 @@ class RendererDxf(RendererBase):
             rgb = gc.get_hatch_color()
             dxfcolor = rgb_to_dxf(rgb)
 
-            # get hatch paths
-            hpath = gc.get_hatch_path()
+            # place the hatch tiles around the center of the parent path
+            tiled = self._get_hatch_tiles(gc, rows, cols, cx, cy)
+            ntiles = len(tiled[0]) if tiled else 0
 
-            # this is a tranform that produces a properly scaled hatch in the center
-            # of the parent hatch
-            _transform = (
-                Affine2D().translate(-0.5, -0.5).scale(self.dpi).translate(cx, cy)
-            )
-            hpatht = hpath.transformed(_transform)
+            attrs = {"color": dxfcolor}
+
+            # clip the hatch to the unclipped parent path, then to the clip
+            # rectangle, as the clipped parts of the parent are not closed
+            parent = transform.transform(path.vertices)
+            if len(parent) < 3:
+                return
+            region = _clip_region(parent)
+            bbox = gc.get_clip_rectangle()
+            if bbox is not None:
+                rect = (bbox.x0, bbox.y0, bbox.x1, bbox.y1)
 
-            # print("\tHatch Path:", hpatht)
             # now place the hatch to cover the parent path
-            for irow in range(-rows, rows + 1):
-                for icol in range(-cols, cols + 1):
-                    # transformation from the center of the parent path
-                    _trans = Affine2D().translate(icol * self.dpi, irow * self.dpi)
-                    # transformed hatch
-                    _hpath = hpatht.transformed(_trans)
-
-                    # turn into list of vertices to make up polygon
-                    _path = _hpath.to_polygons(closed_only=False)
-
-                    for vertices in _path:
-                        if pline is not None:
-                            for (
-                                pline_obj
-                            ) in pline:  # Assuming pline is a list of objects
-                                if len(vertices) == 2:
-                                    clippoly = Polygon(
-                                        pline_obj.vertices()
-                                    )  # Access vertices of each object in the list
-                                    line = LineString(vertices)
-                                    clipped = line.intersection(clippoly).coords
-                                else:
-                                    clipped = ezdxf.math.clipping.ClippingRect2d(
-                                        pline_obj.vertices(), vertices
-                                    )
-                        else:
-                            clipped = []
-
-                        # if there is something to plot
-                        if len(clipped) > 0:
-                            if len(vertices) == 2:
-                                attrs = {"color": dxfcolor}
-                                self.modelspace.add_lwpolyline(
-                                    points=clipped, dxfattribs=attrs
-                                )
-                            else:
-                                # A non-filled polygon or a line - use LWPOLYLINE entity
-                                hatch = self.modelspace.add_hatch(color=dxfcolor)
-                                line = hatch.paths.add_polyline_path(clipped)
+            for itile in range(ntiles):
+                for _path in tiled:
+                    vertices = _path[itile]
+                    if len(vertices) == 2:
+                        # a hatch line
+                        parts = _clip_polyline_to_region(vertices, region)
+                        if bbox is not None:
+                            parts = [
+                                part
+                                for clipped in parts
+                                for part in _clip_polyline_to_rect(clipped, *rect)
+                            ]
+                        for part in parts:
+                            self._add_lwpolyline(part, attrs)
+                        continue
+
+                    # a filled hatch polygon, e.g. a dot or star
+                    parts = _clip_polygon_to_region(vertices, region)
+                    if bbox is not None:
+                        parts = [
+                            part
+                            for clipped in parts
+                            for part in _clip_polygon_to_region(clipped, ("rect", rect))
+                        ]
+                    for part in parts:
+                        hatch = self.modelspace.add_hatch(color=dxfcolor)
+                        hatch.paths.add_polyline_path(part)
 
     def draw_path_collection(
         self,
@@ -327,14 +674,25 @@ class RendererDxf(RendererBase):
         urls,
         offset_position,
     ):
-        for path in paths:
-            combined_transform = master_transform
-            if facecolors.size:
-                rgbFace = facecolors[0] if facecolors is not None else None
-            else:
-                rgbFace = None
+        # the same face colour is used for every path in the collection
+        if facecolors is not None and len(facecolors):
+            rgbFace = facecolors[0]
+        else:
+            rgbFace = None
+
+        paths = list(paths)
+        if not paths:
+            return
+
+        # transform the vertices of all paths in one go
+        lengths = [len(path.vertices) for path in paths]
+        vertices = master_transform.transform(
+            np.concatenate([path.vertices for path in paths])
+        )
+        identity = transforms.IdentityTransform()
+        for path, verts in zip(paths, np.split(vertices, np.cumsum(lengths)[:-1])):
             # Draw each path as a filled patch
-            self._draw_mpl_patch(gc, path, combined_transform, rgbFace=rgbFace)
+            self._draw_mpl_patch(gc, Path(verts, path.codes), identity, rgbFace=rgbFace)
 
     def draw_path(self, gc, path, transform, rgbFace=None):
         # print('\nEntered ###DRAW_PATH###')
@@ -381,12 +739,10 @@ class RendererDxf(RendererBase):
             dxfcolor = rgb_to_dxf(gc.get_rgb())
 
             s = s.replace("\u2212", "-")
-            s.encode("ascii", "ignore").decode()
             if s[0] == "$":
-                pattern = r"\\mathbf\{(.*?)\}"
-                stripped_text = re.sub(pattern, r"\1", s)
-                stripped_text = re.sub(r"[$]", "", stripped_text)
-                stripped_text = re.sub(r"\\/", " ", stripped_text)
+                stripped_text = _MATHBF_RE.sub(r"\1", s)
+                stripped_text = _DOLLAR_RE.sub("", stripped_text)
+                stripped_text = _SLASH_RE.sub(" ", stripped_text)
                 text = self.modelspace.add_text(
                     stripped_text,
                     height=fontsize,
@@ -400,43 +756,11 @@ class RendererDxf(RendererBase):
                     rotation=angle,
                     dxfattribs={"color": dxfcolor},
                 )
-            try:
-                stripped_text
-            except NameError:
-                pass
-
-            if angle == 90.0:
-                if mtext._rotation_mode == "anchor":
-                    halign = self._map_align(mtext.get_ha(), vert=False)
-                else:
-                    halign = "RIGHT"
-                valign = self._map_align(mtext.get_va(), vert=True)
-            else:
-                halign = self._map_align(mtext.get_ha(), vert=False)
-                valign = self._map_align(mtext.get_va(), vert=True)
-
-            align = valign
-            if align:
-                align += "_"
-            align += halign
-
-            # need to create a TextEntityAlignment to work with ezdxf
-            alignment_map = {
-                "TOP_LEFT": TextEntityAlignment.TOP_LEFT,
-                "TOP_CENTER": TextEntityAlignment.TOP_CENTER,
-                "TOP_RIGHT": TextEntityAlignment.TOP_RIGHT,
-                "MIDDLE_LEFT": TextEntityAlignment.MIDDLE_LEFT,
-                "MIDDLE_CENTER": TextEntityAlignment.MIDDLE_CENTER,
-                "MIDDLE_RIGHT": TextEntityAlignment.MIDDLE_RIGHT,
-                "BOTTOM_LEFT": TextEntityAlignment.BOTTOM_LEFT,
-                "BOTTOM_CENTER": TextEntityAlignment.BOTTOM_CENTER,
-                "BOTTOM_RIGHT": TextEntityAlignment.BOTTOM_RIGHT,
-                "LEFT": TextEntityAlignment.LEFT,
-                "CENTER": TextEntityAlignment.CENTER,
-                "RIGHT": TextEntityAlignment.RIGHT,
-            }
-
-            align = alignment_map.get(align, TextEntityAlignment.BOTTOM_LEFT)
+            # vertical text that is not anchored is always right aligned
+            vert = angle == 90.0 and mtext._rotation_mode != "anchor"
+            align = self._ALIGN_TABLE.get(
+                (mtext.get_ha(), mtext.get_va(), vert), TextEntityAlignment.BOTTOM_LEFT
+            )
 
             # need to get original points for text anchoring
             pos = mtext.get_unitless_position()
@@ -446,21 +770,6 @@ class RendererDxf(RendererBase):
             text.set_placement(p1, align=align)
             # print('Left ###TEXT###')
 
-    def _map_align(self, align, vert=False):
-        """Translate a matplotlib text alignment to the ezdxf alignment."""
-        if align in ["right", "center", "left", "top", "bottom", "middle"]:
-            align = align.upper()
-        elif align == "baseline":
-            align = ""
-        elif align == "center_baseline":
-            align = "MIDDLE"
-        else:
-            # print(align)
-            raise NotImplementedError
-        if vert and align == "CENTER":
-            align = "MIDDLE"
-        return align
-
     def open_group(self, s, gid=None):
         # docstring inherited
         self._groupd.append(s)
@@ -478,7 +787,7 @@ class RendererDxf(RendererBase):
         return GraphicsContextBase()
 
     def points_to_pixels(self, points):
-        return points / 72.0 * self.dpi
+        return points * self._pt2px
 
 
 class FigureCanvasDxf(FigureCanvasBase):
@@ -491,13 +800,21 @@ class FigureCanvasDxf(FigureCanvasBase):
     #: supported by ezdxf if desired.
     DXFVERSION = "AC1032"
 
+    #: Tolerance in drawing units used to simplify polylines before they
+    #: are written. ``None`` keeps every vertex.
+    SIMPLIFY_TOLERANCE = None
+
+    #: Thread pool shared by all canvases to write DXF files in the
+    #: background. Threads are only started once a write is submitted.
+    _writer_pool = ThreadPoolExecutor(max_workers=os.cpu_count())
+
     def get_dxf_renderer(self, cleared=False):
         """Get a renderer to use. Will create a new one if we don't
         alreadty have one or if the figure dimensions or resolution have
         changed.
         """
         l, b, w, h = self.figure.bbox.bounds
-        key = w, h, self.figure.dpi
+        key = w, h, self.figure.dpi, self.SIMPLIFY_TOLERANCE
         try:
             self._lastKey, self.dxf_renderer
         except AttributeError:
@@ -506,7 +823,13 @@ class FigureCanvasDxf(FigureCanvasBase):
             need_new_renderer = self._lastKey != key
 
         if need_new_renderer:
-            self.dxf_renderer = RendererDxf(w, h, self.figure.dpi, self.DXFVERSION)
+            self.dxf_renderer = RendererDxf(
+                w,
+                h,
+                self.figure.dpi,
+                self.DXFVERSION,
+                simplify_tolerance=self.SIMPLIFY_TOLERANCE,
+            )
             self._lastKey = key
         elif cleared:
             self.dxf_renderer.clear()
@@ -529,6 +852,32 @@ class FigureCanvasDxf(FigureCanvasBase):
         Write out a DXF file.
         """
         drawing = self.draw()
+        self._write_dxf(drawing, filename)
+
+    def print_dxf_async(self, filename):
+        """
+        Draw the figure and write out the DXF file in a background thread.
+
+        Returns a :class:`concurrent.futures.Future` which completes when
+        the file has been written.
+        """
+        drawing = self.draw()
+        # hand the drawing over to the writer so the next draw starts afresh
+        del self.dxf_renderer
+        return self._writer_pool.submit(self._write_dxf, drawing, filename)
+
+    def save_bytes(self):
+        """
+        Draw the figure and return the DXF file content as bytes.
+        """
+        drawing = self.draw()
+        stream = StringIO()
+        drawing.write(stream)
+        return drawing.encode(stream.getvalue())
+
+    @staticmethod
+    def _write_dxf(drawing, filename):
+        """Write a drawing to a file path or a StringIO."""
         # Check if filename is a BytesIO instance
         if isinstance(filename, StringIO):
             # ezdxf can only write to a string or a file (not BytesIO directly)
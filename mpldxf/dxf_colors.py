@@ -20,8 +20,7 @@ COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
 IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
 CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 """
-from math import sqrt
-
+import numpy as np
 from ezdxf import colors
 
 
@@ -32,18 +31,18 @@ from ezdxf import colors
 BLACK = 250
 WHITE = 255
 
-
-def _distance(target, test):
-    """Get Euclidean distance between two tuples."""
-    return sqrt(sum([(a - b) * (a - b) for a, b in zip(target, test)]))
+# The default ACI palette as an (N, 3) array so the nearest colour search
+# is a single vectorised reduction.
+_PALETTE = np.array(
+    [colors.int2rgb(dxf_color) for dxf_color in colors.DXF_DEFAULT_COLORS],
+    dtype=np.float32,
+)
 
 
 def nearest_index(rgb_color):
     """Get the DXF color index for the color nearest to the RGB color."""
-    distances = [_distance(rgb_color, colors.int2rgb(dxf_color))
-                 for dxf_color in colors.DXF_DEFAULT_COLORS]
-    min_dist = min(distances)
-    idx_min = distances.index(min_dist)
+    diff = _PALETTE - np.asarray(rgb_color, dtype=np.float32)
+    idx_min = int(np.argmin(np.einsum("ij,ij->i", diff, diff)))
     if idx_min == 0:
         idx_min = BLACK
     elif idx_min == 7:
@@ -20,6 +20,7 @@ IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
 CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 """
 
+from io import StringIO
 import unittest
 
 import ezdxf
@@ -28,6 +29,7 @@ from matplotlib import pyplot as plt
 import numpy as np
 from numpy.random import random
 import pytest
+from shapely.geometry import LineString, Polygon
 
 from mpldxf import backend_dxf
 
@@ -123,6 +125,63 @@ class TestDxfBackendCase(unittest.TestCase):
         entity_types = set([entity.dxftype() for entity in entities])
         assert entity_types == {"LWPOLYLINE", "TEXT"}
 
+    def test_plot_line_simplified(self):
+        """Test that dense lines are simplified when a tolerance is set."""
+        x = np.linspace(0, 10, 2000)
+        plt.plot(x, np.sin(x))
+
+        outfile = "tests/files/test_plot_line_simplified.dxf"
+        backend_dxf.FigureCanvasDxf.SIMPLIFY_TOLERANCE = 0.1
+        try:
+            plt.savefig(outfile)
+        finally:
+            backend_dxf.FigureCanvasDxf.SIMPLIFY_TOLERANCE = None
+            plt.close()
+
+        # Load the DXF file and inspect the data line
+        doc = ezdxf.readfile(outfile)
+        modelspace = doc.modelspace()
+        npoints = max(len(entity) for entity in modelspace.query("LWPOLYLINE"))
+        assert 2 < npoints < 2000
+
+    def test_print_dxf_async(self):
+        """Test writing a DXF file in the background."""
+        fig = plt.figure()
+        plt.gca().patch.set_visible(False)
+        plt.plot(range(3), [1, 2, 3])
+        canvas = backend_dxf.FigureCanvasDxf(fig)
+
+        try:
+            outfile = "tests/files/test_print_dxf_async.dxf"
+            future = canvas.print_dxf_async(outfile)
+            future.result()
+        finally:
+            plt.close()
+
+        # Load the DXF file and inspect its content
+        doc = ezdxf.readfile(outfile)
+        modelspace = doc.modelspace()
+        entity_types = set([entity.dxftype() for entity in modelspace])
+        assert entity_types == {"LWPOLYLINE", "TEXT"}
+
+    def test_save_bytes(self):
+        """Test getting the DXF file content as bytes."""
+        fig = plt.figure()
+        plt.gca().patch.set_visible(False)
+        plt.plot(range(3), [1, 2, 3])
+        canvas = backend_dxf.FigureCanvasDxf(fig)
+
+        try:
+            content = canvas.save_bytes()
+        finally:
+            plt.close()
+
+        # DXF R2007 and newer are UTF-8 encoded
+        doc = ezdxf.read(StringIO(content.decode("utf-8")))
+        modelspace = doc.modelspace()
+        entity_types = set([entity.dxftype() for entity in modelspace])
+        assert entity_types == {"LWPOLYLINE", "TEXT"}
+
     def test_boxplot(self):
         """Test a box-plot."""
         data = [
@@ -140,6 +199,137 @@ class TestDxfBackendCase(unittest.TestCase):
         finally:
             plt.close()
 
+    def test_hatched_fill(self):
+        """Test hatched rectangular, convex and non-convex polygons."""
+        parents = {
+            "rect": [(0, 0), (2, 0), (2, 2), (0, 2), (0, 0)],
+            "convex": [(3, 0), (5, 0), (4, 2), (3, 0)],
+            "polygon": [(6, 0), (8, 0), (8, 2), (7, 1), (6, 2), (6, 0)],
+        }
+        for parent in parents.values():
+            x, y = zip(*parent)
+            plt.fill(x, y, hatch="/", fill=False)
+
+        try:
+            outfile = "tests/files/test_hatched_fill.dxf"
+            plt.savefig(outfile)
+        finally:
+            plt.close()
+
+        # check hatch lines are clipped to each kind of parent as Shapely does
+        for kind, parent in parents.items():
+            region = backend_dxf._clip_region(parent)
+            assert region[0] == kind
+            x0 = parent[0][0]
+            for y in np.linspace(-2, 2, 9):
+                segment = [(x0 - 1, y), (x0 + 3, y + 2)]
+                clipped = backend_dxf._clip_polyline_to_region(segment, region)
+                length = sum(LineString(part).length for part in clipped)
+                expected = LineString(segment).intersection(Polygon(parent)).length
+                assert length == pytest.approx(expected)
+
+    def test_hatched_bar_past_ylim(self):
+        """Test hatched bars that extend past the axes."""
+        for pattern in ("/", "o"):
+            sizes = {}
+            for clip_on in (True, False):
+                plt.gca().patch.set_visible(False)
+                plt.axis("off")
+                plt.bar([1], [5], hatch=pattern, fill=False, clip_on=clip_on)
+                plt.ylim(0, 3)
+
+                try:
+                    outfile = "tests/files/test_hatched_bar_past_ylim.dxf"
+                    plt.savefig(outfile)
+                    # the part of the bar inside the axes, in DXF coordinates
+                    visible = Polygon(
+                        plt.gca().transData.transform(
+                            [(0.6, 0), (1.4, 0), (1.4, 3), (0.6, 3)]
+                        )
+                    )
+                finally:
+                    plt.close()
+
+                doc = ezdxf.readfile(outfile)
+                modelspace = doc.modelspace()
+                if pattern == "/":
+                    # the hatch lines are the diagonal ones
+                    lines = [
+                        LineString(entity.get_points(format="xy"))
+                        for entity in modelspace.query("LWPOLYLINE")
+                    ]
+                    shapes = [
+                        line
+                        for line in lines
+                        if len(line.coords) == 2 and np.ptp(line.coords, axis=0).all()
+                    ]
+                else:
+                    # the hatch dots are the only HATCH entities
+                    shapes = [
+                        Polygon([vertex[:2] for vertex in entity.paths[0].vertices])
+                        for entity in modelspace.query("HATCH")
+                    ]
+                if not clip_on:
+                    shapes = [shape.intersection(visible) for shape in shapes]
+                measure = "length" if pattern == "/" else "area"
+                sizes[clip_on] = sum(getattr(shape, measure) for shape in shapes)
+
+            # clipping to the axes should keep exactly the visible hatch
+            assert sizes[True] > 0
+            assert sizes[True] == pytest.approx(sizes[False])
+
+    def test_boxplot_zero_length_whisker(self):
+        """Test a box-plot with a zero-length whisker."""
+        plt.boxplot([[1, 2, 3, 4, 5], [2, 3, 4, 5, 9]])
+
+        try:
+            outfile = "tests/files/test_boxplot_zero_length_whisker.dxf"
+            plt.savefig(outfile)
+        finally:
+            plt.close()
+
+        # Load the DXF file and check no zero-length lines were written
+        doc = ezdxf.readfile(outfile)
+        modelspace = doc.modelspace()
+        for entity in modelspace.query("LWPOLYLINE"):
+            points = np.array(entity.get_points(format="xy"))
+            assert np.ptp(points, axis=0).any()
+
+    def test_hatched_bars(self):
+        """Test bars hatched with a polygon pattern."""
+        plt.gca().patch.set_visible(False)
+        plt.bar([1, 2, 3], [3, 1, 2], hatch="o", fill=False)
+
+        try:
+            outfile = "tests/files/test_hatched_bars.dxf"
+            plt.savefig(outfile)
+        finally:
+            plt.close()
+
+        # Load the DXF file and check the hatch circles were drawn
+        doc = ezdxf.readfile(outfile)
+        modelspace = doc.modelspace()
+        assert len(modelspace.query("HATCH")) > 10
+
+    def test_clip_hatch_dot(self):
+        """Test clipping a filled hatch dot to rectangular, convex and
+        non-convex parents."""
+        # a circle starting at (1, 0), like matplotlib's circle hatches
+        theta = np.linspace(0, 2 * np.pi, 33)
+        dot = np.column_stack([np.cos(theta), np.sin(theta)])
+        parents = {
+            "rect": [(-0.5, -2), (2, -2), (2, 2), (-0.5, 2), (-0.5, -2)],
+            "convex": [(-0.5, -2), (2, -1), (2, 2), (-0.5, 1), (-0.5, -2)],
+            "polygon": [(-0.5, -2), (2, -2), (2, 0.5), (0, 0.5), (0, 2), (-0.5, 2)],
+        }
+        for kind, parent in parents.items():
+            region = backend_dxf._clip_region(parent)
+            assert region[0] == kind
+            clipped = backend_dxf._clip_polygon_to_region(dot, region)
+            area = sum(Polygon(part).area for part in clipped)
+            expected = Polygon(dot).intersection(Polygon(parent)).area
+            assert area == pytest.approx(expected)
+
     def test_contour(self):
         """Test some contours."""
         print("TEST CONTOUR")